@@ -27,6 +27,9 @@ def main():
     parser.add_argument('--attachments', choices=['mirror','none'], help='Attachment handling mode (default: mirror). "mirror" uploads attachments into the GitHub repo; "none" skips them.')
     parser.add_argument('--tracker-mapping', type=str, help='Path to tracker mapping JSON file (default: tracker_mapping.json)')
     parser.add_argument('--user-mapping', type=str, help='Path to user mapping JSON file (default: user_mapping.json)')
+    parser.add_argument('--cache-dir', type=str, help='Directory for the on-disk Redmine response cache (default: .redmine_cache)')
+    parser.add_argument('--cache-max-entries', type=int, help='Maximum number of cached Redmine responses before least recently used ones are evicted (default: 5000)')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the Redmine response cache and always download from Redmine')
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
@@ -80,11 +83,30 @@ def main():
     else:
         logging.info(f"User mapping file '{user_mapping_file}' not found. Users will not be mapped to GitHub accounts.")
 
+    # Determine Redmine response cache settings (CLI overrides env)
+    cache_dir = None
+    cache_max_entries = 5000
+    if args.no_cache or os.getenv('REDMINE_CACHE', '').lower() in ('0', 'off', 'false', 'none'):
+        logging.info("Redmine response cache disabled")
+    else:
+        cache_dir = args.cache_dir or os.getenv('REDMINE_CACHE_DIR', '.redmine_cache')
+        cache_max_entries = args.cache_max_entries if args.cache_max_entries is not None else os.getenv('REDMINE_CACHE_MAX_ENTRIES', '5000')
+        try:
+            cache_max_entries = int(cache_max_entries)
+            if cache_max_entries < 1:
+                raise ValueError("must be at least 1")
+        except ValueError:
+            logging.warning(f"Invalid Redmine cache size '{cache_max_entries}' specified; falling back to 5000.")
+            cache_max_entries = 5000
+        logging.info(f"Redmine response cache: '{cache_dir}' (max {cache_max_entries} entries)")
+
     # Initialize clients
     logging.info("Initializing Redmine and GitHub clients...")
     redmine = RedmineClient(
         url=REDMINE_URL,
-        api_key=REDMINE_API_KEY
+        api_key=REDMINE_API_KEY,
+        cache_dir=cache_dir,
+        cache_max_entries=cache_max_entries
     )
     github = GitHubClient(
         repo=GITHUB_REPO,
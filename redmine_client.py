@@ -1,11 +1,187 @@
 import requests
 import logging
+import os
+import json
+import hashlib
+from collections import OrderedDict
 from typing import Optional
 
+
+class ResponseCache:
+    """On-disk cache of Redmine JSON responses, shared across runs.
+
+    Entries are keyed by URL and request params (the API key is excluded; the
+    caller namespaces `cache_dir` per key instead) and remember the response
+    ETag and, for issue details, the issue's `updated_on`. The index is kept in
+    least-recently-used order; once more than `max_entries` responses are stored,
+    the oldest ones are evicted by `evict()` at the end of a run. Entries used
+    during that run are never evicted, so a cap smaller than one run's working
+    set lets the cache grow past it instead of discarding what the next run
+    will read.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cache_dir: str, max_entries: int = 5000):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._index = OrderedDict()
+        self._used_this_run = set()
+        self._over_cap_warned = False
+        self._dirty = False
+        # Let OSError propagate so the client can fall back to running uncached
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    index = json.load(f)
+                if not isinstance(index, dict):
+                    raise ValueError("index is not a JSON object")
+                self._index = OrderedDict(index)
+            except Exception as e:
+                logging.warning(f"Could not read Redmine cache index '{index_path}': {e}; starting with an empty cache")
+                self._index = OrderedDict()
+
+    @staticmethod
+    def make_key(url: str, params: dict) -> str:
+        items = sorted((k, str(v)) for k, v in params.items() if k != 'key')
+        return url + '?' + '&'.join(f"{k}={v}" for k, v in items)
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def get_entry(self, key: str) -> Optional[dict]:
+        """Return the index entry (etag, updated_on) for key if its body is still on disk."""
+        entry = self._index.get(key)
+        if entry and not os.path.exists(self._body_path(key)):
+            del self._index[key]
+            self._dirty = True
+            return None
+        return entry
+
+    def load(self, key: str):
+        """Return the cached JSON body for key and mark it as recently used, or None."""
+        if key not in self._index:
+            return None
+        try:
+            with open(self._body_path(key), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            logging.debug(f"Could not read cached response for {key}: {e}")
+            self._index.pop(key, None)
+            self._dirty = True
+            return None
+        self._touch(key)
+        return data
+
+    def store(self, key: str, data, etag: Optional[str] = None, updated_on: Optional[str] = None):
+        try:
+            with open(self._body_path(key), 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except Exception as e:
+            logging.warning(f"Could not write cached response for {key}: {e}")
+            return
+        self._index[key] = {'etag': etag, 'updated_on': updated_on}
+        self._touch(key)
+
+    def _touch(self, key: str):
+        self._index.move_to_end(key)
+        self._used_this_run.add(key)
+        self._dirty = True
+
+    def evict(self):
+        """Trim the cache back to `max_entries`, oldest first.
+
+        Called once at the end of a run rather than on every store, so entries
+        the run has yet to read are never dropped mid-scan.
+        """
+        evicted = 0
+        while len(self._index) > self.max_entries:
+            # Entries used this run sit at the end, so reaching one means every
+            # remaining entry is part of the current working set
+            key = next(iter(self._index))
+            if key in self._used_this_run:
+                if not self._over_cap_warned:
+                    logging.warning(f"Redmine cache limit ({self.max_entries} entries) is smaller than the responses used in this run; "
+                                    f"keeping them all. Raise --cache-max-entries above the number of issues.")
+                    self._over_cap_warned = True
+                break
+            del self._index[key]
+            try:
+                os.remove(self._body_path(key))
+            except OSError:
+                pass
+            evicted += 1
+        if evicted:
+            logging.debug(f"Evicted {evicted} least recently used responses from Redmine cache")
+
+    def save(self):
+        """Persist the index so the next run can reuse cached responses."""
+        if not self._dirty:
+            return
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        tmp_path = index_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, index_path)
+            self._dirty = False
+        except Exception as e:
+            logging.warning(f"Could not write Redmine cache index '{index_path}': {e}")
+
+
 class RedmineClient:
-    def __init__(self, url, api_key):
+    def __init__(self, url, api_key, cache_dir: Optional[str] = None, cache_max_entries: int = 5000):
         self.url = url.rstrip('/')
         self.api_key = api_key
+        # Optional on-disk response cache; None disables caching
+        self.cache = None
+        if cache_dir:
+            # Redmine returns different data per API key (private issues and notes),
+            # so each key gets its own subdirectory named by a hash of the key
+            key_hash = hashlib.sha256((api_key or '').encode('utf-8')).hexdigest()[:12]
+            try:
+                self.cache = ResponseCache(os.path.join(cache_dir, key_hash), cache_max_entries)
+            except OSError as e:
+                logging.warning(f"Could not create Redmine cache directory '{cache_dir}': {e}; continuing without cache")
+        self.cache_hits = 0
+
+    def _get_json(self, url: str, params: dict, updated_on: Optional[str] = None):
+        """GET a Redmine JSON resource, reusing the on-disk cache when possible.
+
+        If `updated_on` is given and matches the cached copy, the cached body is
+        returned without contacting Redmine. Otherwise a conditional request is
+        sent with If-None-Match and a 304 response is served from the cache.
+        """
+        if not self.cache:
+            resp = requests.get(url, params=params, verify=False)
+            resp.raise_for_status()
+            return resp.json()
+
+        key = ResponseCache.make_key(url, params)
+        entry = self.cache.get_entry(key)
+        if entry and updated_on and entry.get('updated_on') == updated_on:
+            data = self.cache.load(key)
+            if data is not None:
+                self.cache_hits += 1
+                return data
+
+        headers = {}
+        if entry and entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        resp = requests.get(url, params=params, headers=headers, verify=False)
+        if resp.status_code == 304:
+            data = self.cache.load(key)
+            if data is not None:
+                self.cache_hits += 1
+                return data
+            # Cached body vanished; refetch unconditionally
+            resp = requests.get(url, params=params, verify=False)
+        resp.raise_for_status()
+        data = resp.json()
+        self.cache.store(key, data, etag=resp.headers.get('ETag'), updated_on=updated_on)
+        return data
 
     def get_issues(self, limit: Optional[int] = None, start_from: int = 0, include_attachments: bool = False):
         issues = []
@@ -22,9 +198,7 @@ class RedmineClient:
             if include_attachments:
                 params['include'] = 'attachments'
             logging.info(f"Requesting Redmine issues: offset={current_offset}, limit={batch_limit}")
-            resp = requests.get(f"{self.url}/issues.json", params=params, verify=False)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._get_json(f"{self.url}/issues.json", params)
 
             # Filter issues based on start_from issue number
             filtered_issues = []
@@ -35,9 +209,7 @@ class RedmineClient:
                     try:
                         detail_url = f"{self.url}/issues/{issue_id}.json"
                         detail_params = {'key': self.api_key, 'include': 'journals,details'}
-                        detail_resp = requests.get(detail_url, params=detail_params, verify=False)
-                        detail_resp.raise_for_status()
-                        detail_data = detail_resp.json()
+                        detail_data = self._get_json(detail_url, detail_params, updated_on=issue.get('updated_on'))
                         if 'issue' in detail_data and 'journals' in detail_data['issue']:
                             issue['journals'] = detail_data['issue']['journals']
                         else:
@@ -48,6 +220,8 @@ class RedmineClient:
                     filtered_issues.append(issue)
 
             issues.extend(filtered_issues)
+            if self.cache:
+                self.cache.save()
             logging.info(f"Received {len(data['issues'])} issues, {len(filtered_issues)} after filtering (total so far: {len(issues)})")
 
             # Early stop if limit reached
@@ -65,6 +239,11 @@ class RedmineClient:
 
             current_offset += batch_limit
 
+        if self.cache:
+            self.cache.evict()
+            self.cache.save()
+            logging.info(f"Served {self.cache_hits} Redmine responses from local cache '{self.cache.cache_dir}'")
+
         # Ensure correct order and apply limit
         issues.sort(key=lambda x: x.get('id', 0))
         if limit: